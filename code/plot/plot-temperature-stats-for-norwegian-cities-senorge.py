@@ -10,13 +10,28 @@ focusing on December–January–February (DJF) for a given year. The code:
    - Grid lines on the timeseries are removed.
 """
 
+import pickle
+
+import numpy as np
 import xarray as xr
 import matplotlib.pyplot as plt
 import cartopy.crs as ccrs
 import cartopy.feature as cfeature
 import matplotlib.dates as mdates
+from matplotlib.patches import Rectangle
 
 from trygzerodegreedayscities import config, misc
+from trygzerodegreedayscities.bboxes import BBOXES
+
+# Cartopy features as module-level singletons, so the Natural Earth
+# shapefiles behind them are loaded and reprojected once per session
+_COASTLINE = cfeature.COASTLINE
+_BORDERS   = cfeature.BORDERS
+_LAND      = cfeature.LAND
+_LAKES     = cfeature.LAKES
+_RIVERS    = cfeature.RIVERS
+
+_base_map_pickle = None
 
 # input --------------------------------------------
 city       = 'Alta'
@@ -27,55 +42,6 @@ path_out   = config.dirs['fig']
 write2file = True
 # --------------------------------------------------
 
-def get_city_bboxes():
-    """
-    Returns a dictionary of city bounding boxes.
-    Each entry has lat_min, lat_max, lon_min, lon_max.
-    """
-    return {
-        "Oslo": {
-            "lat_min": 59.70, "lat_max": 60.25,
-            "lon_min": 10.40, "lon_max": 11.10
-        },
-        "Kristiansand": {
-            "lat_min": 58.00, "lat_max": 58.30,
-            "lon_min":  7.80, "lon_max":  8.20
-        },
-        "Stavanger": {
-            "lat_min": 58.80, "lat_max": 59.10,
-            "lon_min":  5.50, "lon_max":  6.00
-        },
-        "Bergen": {
-            "lat_min": 60.20, "lat_max": 60.55,
-            "lon_min":  5.10, "lon_max":  5.50
-        },
-        "Ålesund": {
-            "lat_min": 62.30, "lat_max": 62.60,
-            "lon_min":  5.90, "lon_max":  6.40
-        },
-        "Trondheim": {
-            "lat_min": 63.30, "lat_max": 63.55,
-            "lon_min": 10.20, "lon_max": 10.60
-        },
-        "Bodø": {
-            "lat_min": 67.10, "lat_max": 67.40,
-            "lon_min": 14.20, "lon_max": 14.60
-        },
-        "Tromsø": {
-            "lat_min": 69.50, "lat_max": 69.80,
-            "lon_min": 18.60, "lon_max": 19.20
-        },
-        "Lillehammer": {
-            "lat_min": 61.00, "lat_max": 61.20,
-            "lon_min": 10.20, "lon_max": 10.70
-        },
-        "Alta": {
-            "lat_min": 69.80, "lat_max": 70.10,
-            "lon_min": 23.00, "lon_max": 23.50
-        }
-    }
-
-
 def plot_time_series_with_subzero(tn_mean, city, year, write2file):
     """
     Plots a time series of daily min temperatures for DJF, shading days below 0°C.
@@ -93,22 +59,26 @@ def plot_time_series_with_subzero(tn_mean, city, year, write2file):
     """
     fig, ax = plt.subplots(figsize=(8, 4))
 
-    # Convert the DataArray to numpy for fill_between
+    # Convert the DataArray to numpy for fill_between, and the time axis
+    # to float ordinals once so matplotlib's datetime converter does not
+    # walk the datetime array element-wise on every artist
     time_vals = tn_mean["time"].values
     temp_vals = tn_mean.values
+    time_num  = mdates.date2num(time_vals)
 
     # Plot the daily min temperature
-    ax.plot(time_vals, temp_vals, color="blue")
+    ax.plot(time_num, temp_vals, color="blue")
 
     # Draw a zero reference line
     ax.axhline(y=0, color='k', linestyle='--', linewidth=1)
 
-    # Shade the area below zero
+    # Shade the area below zero; clipping the series at zero lets
+    # matplotlib draw one polygon instead of splitting at each crossing
+    below = np.minimum(temp_vals, 0.0)
     ax.fill_between(
-        time_vals,
-        temp_vals,
+        time_num,
+        below,
         0,
-        where=(temp_vals < 0),
         color="blue",
         alpha=0.3,
         label="Below 0°C"
@@ -122,14 +92,14 @@ def plot_time_series_with_subzero(tn_mean, city, year, write2file):
         ylabel = 'daily mean temperature (°C)'
     ax.set_ylabel(ylabel)
 
-    # Compute sub-zero counts for each month
-    tn_dec = tn_mean.sel(time=tn_mean.time.dt.month == 12)
-    tn_jan = tn_mean.sel(time=tn_mean.time.dt.month == 1)
-    tn_feb = tn_mean.sel(time=tn_mean.time.dt.month == 2)
+    # Compute sub-zero counts for all months in a single pass
+    months = tn_mean["time"].dt.month.values
+    below_zero = (temp_vals < 0).astype(np.int64)
+    counts = np.bincount(months, weights=below_zero, minlength=13)
 
-    dec_count = (tn_dec < 0).sum().item()
-    jan_count = (tn_jan < 0).sum().item()
-    feb_count = (tn_feb < 0).sum().item()
+    dec_count = int(counts[12])
+    jan_count = int(counts[1])
+    feb_count = int(counts[2])
 
     # Annotate with sub-zero day counts
     info_text = (
@@ -141,6 +111,9 @@ def plot_time_series_with_subzero(tn_mean, city, year, write2file):
     ax.text(0.02, 0.95, info_text, transform=ax.transAxes,
             va='top', ha='left', bbox=dict(boxstyle="round", alpha=0.2))
 
+    # Treat the float ordinals as dates for tick handling
+    ax.xaxis_date()
+
     # Set major ticks at 1st and 15th of each month
     ax.xaxis.set_major_locator(mdates.DayLocator(bymonthday=[1, 15]))
     
@@ -157,6 +130,40 @@ def plot_time_series_with_subzero(tn_mean, city, year, write2file):
     plt.show()
 
 
+def get_base_map():
+    """
+    Returns a fresh (fig, ax) with the static geographic features drawn.
+
+    Rendering the Cartopy features dominates the cost of each map, so the
+    configured figure is built once and cached as a pickle; subsequent
+    calls (e.g. one map per city in a batch run) restore a copy instead
+    of re-drawing the features from scratch.
+    """
+    global _base_map_pickle
+
+    if _base_map_pickle is None:
+        fig = plt.figure(figsize=(6, 5))
+        ax = fig.add_subplot(111, projection=ccrs.PlateCarree())
+
+        # Add some geographic features
+        ax.add_feature(_COASTLINE, linewidth=0.5)
+        ax.add_feature(_BORDERS,   linestyle=':')
+        ax.add_feature(_LAND,      alpha=0.3)
+        ax.add_feature(_LAKES,     alpha=0.5)
+        ax.add_feature(_RIVERS,    alpha=0.5)
+
+        _base_map_pickle = pickle.dumps(fig)
+
+        # Close the template figure so only the restored copies are
+        # registered with pyplot and shown
+        plt.close(fig)
+
+    fig = pickle.loads(_base_map_pickle)
+    ax = fig.axes[0]
+
+    return fig, ax
+
+
 def plot_bounding_box_map(ds, city, bbox, write2file):
     """
     Plots a map with the native data grid and the bounding box for the given city,
@@ -182,33 +189,15 @@ def plot_bounding_box_map(ds, city, bbox, write2file):
     else:
         ds_plot = ds
 
-    fig = plt.figure(figsize=(6, 5))
-    ax = fig.add_subplot(111, projection=ccrs.PlateCarree())
+    fig, ax = get_base_map()
 
-    # Add some geographic features
-    ax.add_feature(cfeature.COASTLINE, linewidth=0.5)
-    ax.add_feature(cfeature.BORDERS,   linestyle=':')
-    ax.add_feature(cfeature.LAND,      alpha=0.3)
-    ax.add_feature(cfeature.LAKES,     alpha=0.5)
-    ax.add_feature(cfeature.RIVERS,    alpha=0.5)
-
-    # Draw bounding box in red
-    ax.plot(
-        [lon_min, lon_max], [lat_min, lat_min],
-        color="red", transform=ccrs.PlateCarree()
-    )
-    ax.plot(
-        [lon_min, lon_max], [lat_max, lat_max],
-        color="red", transform=ccrs.PlateCarree()
-    )
-    ax.plot(
-        [lon_min, lon_min], [lat_min, lat_max],
-        color="red", transform=ccrs.PlateCarree()
-    )
-    ax.plot(
-        [lon_max, lon_max], [lat_min, lat_max],
-        color="red", transform=ccrs.PlateCarree()
-    )
+    # Draw bounding box in red as a single patch (one artist, one transform)
+    ax.add_patch(Rectangle(
+        (lon_min, lat_min),
+        lon_max - lon_min,
+        lat_max - lat_min,
+        fill=False, edgecolor="red", transform=ccrs.PlateCarree()
+    ))
 
     # Zoom the map around the bounding box
     ax.set_extent(
@@ -240,29 +229,39 @@ def analyze_djf_temperature(year,city,variable,path_in,path_out,write2file=False
         city = "Oslo"  # default if no city is provided
 
     # 1) Retrieve bounding box
-    bboxes = get_city_bboxes()
-    if city not in bboxes:
+    if city not in BBOXES:
         raise ValueError(f"City '{city}' not found in bounding-box dictionary.")
-    bbox = bboxes[city]
+    bbox = BBOXES[city]
 
-    # 2) Gather the necessary data for Dec(year-1), Jan/Feb(year)
+    # 2) Gather the necessary data for Dec(year-1), Jan/Feb(year),
+    #    opened without CF decoding
     year_prev = year - 1
     dec_file = f"{path_in}/{variable}/{variable}_{year_prev}.nc"
     jf_file  = f"{path_in}/{variable}/{variable}_{year}.nc"
 
-    ds_dec = xr.open_dataset(dec_file).sel(time=slice(f"{year_prev}-12-01", f"{year_prev}-12-31"))
-    ds_jf  = xr.open_dataset(jf_file).sel(time=slice(f"{year}-01-01", f"{year}-02-28"))
+    ds_dec = xr.open_dataset(dec_file, decode_cf=False, decode_coords=False,
+                             decode_times=False, mask_and_scale=False)
+    ds_jf  = xr.open_dataset(jf_file, decode_cf=False, decode_coords=False,
+                             decode_times=False, mask_and_scale=False)
+
+    # 3) Spatial subset to bounding box, then decode CF metadata on the
+    #    small block only before selecting the DJF window
+    y_slice, x_slice = misc.get_city_isel(city, dec_file)
+
+    ds_dec = xr.decode_cf(ds_dec.isel(Y=y_slice, X=x_slice))
+    ds_dec = ds_dec.sel(time=slice(f"{year_prev}-12-01", f"{year_prev}-12-31"))
+
+    ds_jf = xr.decode_cf(ds_jf.isel(Y=y_slice, X=x_slice))
+    ds_jf = ds_jf.sel(time=slice(f"{year}-01-01", f"{year}-02-28"))
+
     ds_djf = xr.concat([ds_dec, ds_jf], dim='time')
 
-    # 3) Spatial subset to bounding box
-    ds_subset = ds_djf.where(
-        (ds_djf["lat"] >= bbox["lat_min"]) & (ds_djf["lat"] <= bbox["lat_max"]) &
-        (ds_djf["lon"] >= bbox["lon_min"]) & (ds_djf["lon"] <= bbox["lon_max"]),
-        drop=True
-    )
+    # Mask rectangle cells that fall outside the bounding box so the
+    # spatial mean uses the same cells as the old where(..., drop=True)
+    ds_djf = misc.mask_city_bbox(ds_djf, city)
 
     # 4) Compute the spatial mean across Y, X
-    tn_mean = ds_subset[variable].mean(dim=["Y", "X"])
+    tn_mean = ds_djf[variable].mean(dim=["Y", "X"])
 
     # write to file
     #if write2file:
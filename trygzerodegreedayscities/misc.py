@@ -1,73 +1,89 @@
 """
-collection of useful miscellaneous functions                                                                                                                  
+collection of useful miscellaneous functions
 """
+import functools
+import time
+from contextlib import contextmanager
+
 import numpy  as np
 import xarray as xr
 
-
-def tic():
-    # Homemade version of matlab tic function
-    import time
-    global startTime_for_tictoc
-    startTime_for_tictoc = time.time()
+from trygzerodegreedayscities.bboxes import BBOXES
 
 
-def toc():
-    # Homemade version of matlab tic function
-    import time
-    if 'startTime_for_tictoc' in globals():
-        print("Elapsed time is " + str(time.time() - startTime_for_tictoc) + " seconds.")
-    else:
-        print("Toc: start time not set")
+@contextmanager
+def timed(label=""):
+    """
+    Times the enclosed block and prints the elapsed wall time.
+    Replacement for the old matlab-style tic/toc global pair.
+    """
+    t0 = time.perf_counter_ns()
+    yield
+    elapsed = (time.perf_counter_ns() - t0) / 1e9
+    print(f"{label} elapsed time is {elapsed:.3f} seconds.")
 
 
 def get_city_bboxes(city):
     """
-    Returns a dictionary of city bounding boxes.
+    Returns the bounding box of a city from the shared BBOXES constant.
     Each entry has lat_min, lat_max, lon_min, lon_max.
     """
+    return BBOXES[city]
+
+
+@functools.lru_cache(maxsize=None)
+def get_city_isel(city, filename):
+    """
+    Returns integer (Y, X) slices covering the bounding box of a city on
+    the grid of the given NetCDF file.
+
+    For 1D lat/lon coordinates the bounds are found with np.searchsorted;
+    for 2D (curvilinear) coordinates the enclosing index rectangle is
+    computed from the bounding-box mask. The result is cached per
+    (city, filename), so repeated reads of the same grid pay no per-call
+    indexing cost and can slice with ds.isel(Y=y_slice, X=x_slice).
+    """
+    bbox = get_city_bboxes(city)
+
+    with xr.open_dataset(filename) as ds:
+        lats = ds["lat"].values
+        lons = ds["lon"].values
+
+    if lats.ndim == 1:
+        if lats[0] > lats[-1] or lons[0] > lons[-1]:
+            raise ValueError(
+                "get_city_isel expects ascending 1D lat/lon coordinates."
+            )
+        # side='left'/'right' give inclusive bounds: exactly the points
+        # with lat_min <= lat <= lat_max (same for lon)
+        i0 = np.searchsorted(lats, bbox["lat_min"], side="left")
+        i1 = np.searchsorted(lats, bbox["lat_max"], side="right")
+        j0 = np.searchsorted(lons, bbox["lon_min"], side="left")
+        j1 = np.searchsorted(lons, bbox["lon_max"], side="right")
+    else:
+        mask = (
+            (lats >= bbox["lat_min"]) & (lats <= bbox["lat_max"])
+            & (lons >= bbox["lon_min"]) & (lons <= bbox["lon_max"])
+        )
+        yy, xx = np.nonzero(mask)
+        i0, i1 = yy.min(), yy.max() + 1
+        j0, j1 = xx.min(), xx.max() + 1
+
+    return slice(i0, i1), slice(j0, j1)
+
+
+def mask_city_bbox(ds, city):
+    """
+    Masks cells outside the city's bounding box with NaN.
+
+    get_city_isel returns the enclosing index rectangle, which on a
+    curvilinear grid over-covers the bounding box. Applying this mask to
+    the small block before a skipna spatial mean reproduces the exact
+    cell selection of the old where(..., drop=True) approach.
+    """
+    bbox = get_city_bboxes(city)
 
-    bboxes = {
-        "Oslo": {
-            "lat_min": 59.70, "lat_max": 60.25,
-            "lon_min": 10.40, "lon_max": 11.10
-        },
-        "Kristiansand": {
-            "lat_min": 58.00, "lat_max": 58.30,
-            "lon_min":  7.80, "lon_max":  8.20
-        },
-        "Stavanger": {
-            "lat_min": 58.80, "lat_max": 59.10,
-            "lon_min":  5.50, "lon_max":  6.00
-        },
-        "Bergen": {
-            "lat_min": 60.20, "lat_max": 60.55,
-            "lon_min":  5.10, "lon_max":  5.50
-        },
-        "Ålesund": {
-            "lat_min": 62.30, "lat_max": 62.60,
-            "lon_min":  5.90, "lon_max":  6.40
-        },
-        "Trondheim": {
-            "lat_min": 63.30, "lat_max": 63.55,
-            "lon_min": 10.20, "lon_max": 10.60
-        },
-        "Bodø": {
-            "lat_min": 67.10, "lat_max": 67.40,
-            "lon_min": 14.20, "lon_max": 14.60
-        },
-        "Tromsø": {
-            "lat_min": 69.50, "lat_max": 69.80,
-            "lon_min": 18.60, "lon_max": 19.20
-        },
-        "Lillehammer": {
-            "lat_min": 61.00, "lat_max": 61.20,
-            "lon_min": 10.20, "lon_max": 10.70
-        },
-        "Alta": {
-            "lat_min": 69.80, "lat_max": 70.10,
-            "lon_min": 23.00, "lon_max": 23.50
-        }
-    }
-
-    return bboxes[city]
+    return ds.where(
+        (ds["lat"] >= bbox["lat_min"]) & (ds["lat"] <= bbox["lat_max"])
+        & (ds["lon"] >= bbox["lon_min"]) & (ds["lon"] <= bbox["lon_max"])
+    )